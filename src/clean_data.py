@@ -24,10 +24,14 @@ Cleaning steps:
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Optional, Tuple
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 
 # -----------------------------
@@ -52,6 +56,9 @@ EVENT_END   = "2025-12-15"
 MIN_HEADLINE_CHARS = 8
 MIN_BODY_WORDS = 60  # helps remove paywall/landing pages
 
+# Body text that looks like navigation / very generic page chrome
+NAV_TEXT_RE = re.compile(r"\b(?:Home|Skip to content|BBC Homepage|News)\b", re.IGNORECASE)
+
 # Balance control
 MAX_PER_SECTION = 120  # cap per section so analysis can take ~100 later
 
@@ -64,68 +71,76 @@ def ensure_dirs() -> None:
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def load_raw_metadata(path: Path) -> pd.DataFrame:
+    """
+    Read metadata.csv with Arrow's multithreaded CSV parser into Arrow-backed columns
+    (faster and smaller than object dtype). published_at is kept as text so it is
+    written back out exactly as scraped; parse_dates handles the conversion.
+    """
+    convert_options = pa_csv.ConvertOptions(
+        column_types={"published_at": pa.string()},
+        strings_can_be_null=True,
+    )
+    # Scraped fields can hold quoted newlines; Arrow must not split blocks inside them
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    table = pa_csv.read_csv(path, parse_options=parse_options, convert_options=convert_options)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
 def parse_dates(df: pd.DataFrame) -> pd.DataFrame:
     """
     Parse published_at into datetime and derive published_date.
     Rows with unparsable dates become NaT and can be filtered.
     """
-    df = df.copy()
-    df["published_dt"] = pd.to_datetime(df["published_at"], errors="coerce", utc=True)
-    df["published_date"] = df["published_dt"].dt.date.astype("string")
+    # published_at is ISO 8601 (see get_data.parse_article_page); an explicit format skips inference
+    dt = pd.to_datetime(df["published_at"], errors="coerce", utc=True, format="ISO8601", cache=True)
+    # parse_article_page stores non-ISO dates as scraped; parse those leftovers per value
+    retry = dt.isna() & df["published_at"].notna()
+    if retry.any():
+        dt[retry] = pd.to_datetime(df.loc[retry, "published_at"], errors="coerce", utc=True, format="mixed")
+    df["published_dt"] = dt
+    df["published_date"] = df["published_dt"].dt.strftime("%Y-%m-%d")
     return df
 
 
 def basic_filters(df: pd.DataFrame) -> pd.DataFrame:
     """
     Remove obvious non-article rows and low-quality rows.
+    All conditions are combined into one mask so the frame is sliced only once.
     """
-    df = df.copy()
-
     # headline quality
     df["headline"] = df["headline"].fillna("").astype(str).str.strip()
     df["body_preview"] = df["body_preview"].fillna("").astype(str).str.strip()
+    df["body_words"] = df["body_preview"].str.count(r"\S+")
 
-    # Remove "NewsNews" and similar generic titles
+    # Remove "NewsNews" and similar generic titles, and very short headlines
     bad_headlines = {"newsnews", "news", "bbc news"}
-    df = df[~df["headline"].str.lower().isin(bad_headlines)]
+    headline = df["headline"]
+    keep_headline = ~headline.str.lower().isin(bad_headlines) & (headline.str.len() >= MIN_HEADLINE_CHARS)
 
-    # Remove very short headline/body
-    df = df[df["headline"].str.len() >= MIN_HEADLINE_CHARS]
-    df["body_words"] = df["body_preview"].str.split().map(len)
-    df = df[df["body_words"] >= MIN_BODY_WORDS]
+    # Remove very short bodies and bodies that look like navigation / very generic
+    keep_body = (df["body_words"] >= MIN_BODY_WORDS) & ~df["body_preview"].str.contains(NAV_TEXT_RE)
 
     # Drop rows missing critical fields
-    df = df.dropna(subset=["url", "section"])
-
-    # Drop rows where body_preview looks like navigation / very generic
-    df = df[~df["body_preview"].str.contains(r"\b(?:Home|Skip to content|BBC Homepage|News)\b", case=False, regex=True)]
+    keep_fields = df["url"].notna() & df["section"].notna()
 
-    return df
+    return df[keep_headline & keep_body & keep_fields]
 
 
 def filter_event_window(df: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
-    df = df.copy()
-
-    # Split into (has date) and (missing date)
-    df_has = df.dropna(subset=["published_dt"]).copy()
-    df_miss = df[df["published_dt"].isna()].copy()
-
     start = pd.to_datetime(start_date, utc=True)
     end = pd.to_datetime(end_date, utc=True) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
 
-    df_has = df_has[df_has["published_dt"].between(start, end)]
-
-    # Keep missing-date rows (they can be used for section-level comparisons)
-    return pd.concat([df_has, df_miss], ignore_index=True)
-
-
+    # Keep rows inside the window, plus missing-date rows
+    # (they can be used for section-level comparisons)
+    dt = df["published_dt"]
+    return df[dt.isna() | dt.between(start, end)]
 
 
 def deduplicate(df: pd.DataFrame) -> pd.DataFrame:
     """
     Drop duplicates by URL (keep first).
     """
-    df = df.copy()
     df = df.drop_duplicates(subset=["url"], keep="first")
     return df
 
@@ -135,15 +150,11 @@ def cap_per_section(df: pd.DataFrame, max_per_section: int) -> pd.DataFrame:
     Cap number of articles per section to improve balance.
     Strategy: keep most recent articles first.
     """
-    df = df.copy()
-    df = df.sort_values(by=["section", "published_dt"], ascending=[True, False])
+    df = df.sort_values("published_dt", ascending=False, kind="stable")
+    keep = df.groupby("section", sort=False).cumcount() < max_per_section
 
-    capped = (
-        df.groupby("section", group_keys=False)
-        .head(max_per_section)
-        .reset_index(drop=True)
-    )
-    return capped
+    # Sort only the kept rows by section so the output stays grouped by section
+    return df[keep].sort_values("section", kind="stable").reset_index(drop=True)
 
 
 def select_output_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -161,7 +172,24 @@ def select_output_columns(df: pd.DataFrame) -> pd.DataFrame:
     ]
     # Some columns might not exist depending on earlier scripts; keep what exists
     existing = [c for c in cols if c in df.columns]
-    return df[existing].copy()
+    return df[existing]
+
+
+def _json_default(obj: object) -> None:
+    """orjson fallback: pandas missing-value scalars (pd.NA / NaT) become null."""
+    if pd.isna(obj):
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def write_jsonl(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write one JSON object per row, encoding each record with orjson (UTF-8, no ASCII escaping).
+    """
+    with path.open("wb") as f:
+        for rec in df.to_dict(orient="records"):
+            f.write(orjson.dumps(rec, default=_json_default))
+            f.write(b"\n")
 
 
 def main() -> None:
@@ -170,7 +198,7 @@ def main() -> None:
     if not RAW_META_PATH.exists():
         raise FileNotFoundError(f"Missing raw metadata file: {RAW_META_PATH}")
 
-    df = pd.read_csv(RAW_META_PATH)
+    df = load_raw_metadata(RAW_META_PATH)
     print(f"[LOAD] Raw metadata rows: {len(df)}")
 
     df = parse_dates(df)
@@ -190,7 +218,7 @@ def main() -> None:
     out_df = select_output_columns(df)
 
     out_df.to_csv(OUT_CSV_PATH, index=False, encoding="utf-8")
-    out_df.to_json(OUT_JSONL_PATH, orient="records", lines=True, force_ascii=False)
+    write_jsonl(out_df, OUT_JSONL_PATH)
 
     print(f"\n[WRITE] Clean CSV:   {OUT_CSV_PATH.relative_to(PROJECT_ROOT)}")
     print(f"[WRITE] Clean JSONL: {OUT_JSONL_PATH.relative_to(PROJECT_ROOT)}")
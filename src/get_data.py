@@ -14,21 +14,33 @@ Notes:
 - We collect articles from BBC section landing pages (World, Business, Technology).
 - We attempt to parse publication date from <time datetime="..."> when available.
 - We store headline text and a short body preview (first few paragraphs).
+- Article pages are downloaded by a small thread pool; a shared rate limiter
+  keeps the overall request rate at one request per SLEEP_SECONDS.
+- Each accepted article is appended to metadata.csv immediately. Re-running
+  resumes: URLs already in metadata.csv are skipped and count toward the
+  per-section cap (delete the file to start from scratch).
 """
 
 from __future__ import annotations
 
+import csv
 import hashlib
 import re
+import threading
 import time
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
-import pandas as pd
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # -----------------------------
@@ -42,7 +54,9 @@ USER_AGENT: str = (
 )
 
 REQUEST_TIMEOUT: int = 15
-SLEEP_SECONDS: float = 1.0  # be polite to the website
+SLEEP_SECONDS: float = 1.0  # be polite to the website (global, across threads)
+MAX_WORKERS: int = 8  # concurrent article downloads
+URL_CACHE_SIZE: int = 4096  # nav / related-story links repeat across section and search pages
 MAX_ARTICLES_PER_SECTION: int = 120  # target ~100 each after filtering
 MIN_BODY_WORDS: int = 60  # filter out nav pages / very short content
 
@@ -59,6 +73,22 @@ SECTION_KEYWORDS = {
     "technology": ["AI", "OpenAI", "Google", "Apple", "Microsoft", "chip", "semiconductor", "quantum", "cyber", "TikTok"],
 }
 
+# URL filters (compiled once; is_probably_article_url runs for every <a href> we see)
+BAD_URL_KEYWORDS: Tuple[str, ...] = (
+    "/videos/", "/live/", "/topics/", "/av/", "/in_pictures", "/special/", "/resources/",
+)
+BAD_URL_RE: re.Pattern = re.compile("|".join(map(re.escape, BAD_URL_KEYWORDS)))
+# https://www.bbc.com/news/articles/<id>
+ARTICLE_URL_RE1: re.Pattern = re.compile(r"^https://www\.bbc\.com/news/articles/[a-z0-9]+$")
+# https://www.bbc.com/news/<section>/<article_id>, where article_id usually starts with 'c'
+ARTICLE_URL_RE2: re.Pattern = re.compile(r"^https://www\.bbc\.com/news/[^/]+/c[a-z0-9]{8,}$")
+# normalize_bbc_url: domain aliases rewritten to https://www.bbc.com, and query/fragment tail
+BBC_DOMAIN_RE: re.Pattern = re.compile(r"^(?:https?://www\.bbc\.co\.uk|http://www\.bbc\.com)")
+URL_TAIL_RE: re.Pattern = re.compile(r"[?#].*", re.DOTALL)
+
+# Text nodes under an element, skipping <script>/<style> contents
+TEXT_NODES_XPATH: etree.XPath = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
+
 
 PROJECT_ROOT: Path = Path(__file__).resolve().parents[1]
 RAW_DIR: Path = PROJECT_ROOT / "data" / "raw"
@@ -66,6 +96,58 @@ RAW_HTML_DIR: Path = RAW_DIR / "html"
 METADATA_PATH: Path = RAW_DIR / "metadata.csv"
 
 
+# -----------------------------
+# HTTP Session
+# -----------------------------
+
+def build_session() -> requests.Session:
+    """
+    Build a shared requests.Session so connections (and TLS handshakes) are
+    reused across section, search and article fetches. Transient failures
+    (rate limiting, 5xx) are retried with exponential backoff.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION: requests.Session = build_session()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that hands out one request slot every
+    `interval` seconds, so the global request rate stays at 1/interval
+    no matter how many worker threads are fetching.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self) -> None:
+        """Block until the caller's request slot is due."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+RATE_LIMITER: RateLimiter = RateLimiter(SLEEP_SECONDS)
+
+
 # -----------------------------
 # Data Structures
 # -----------------------------
@@ -80,6 +162,9 @@ class ArticleRecord:
     raw_html_path: str
 
 
+METADATA_FIELDS: List[str] = [f.name for f in fields(ArticleRecord)]
+
+
 # -----------------------------
 # Helpers
 # -----------------------------
@@ -90,6 +175,7 @@ def ensure_dirs() -> None:
     RAW_HTML_DIR.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def normalize_bbc_url(url: str) -> str:
     """
     Normalize BBC URLs:
@@ -102,19 +188,16 @@ def normalize_bbc_url(url: str) -> str:
         url = "https://www.bbc.com" + url
 
     # unify domain
-    url = url.replace("https://www.bbc.co.uk", "https://www.bbc.com")
-    url = url.replace("http://www.bbc.co.uk", "https://www.bbc.com")
-    url = url.replace("http://www.bbc.com", "https://www.bbc.com")
+    url = BBC_DOMAIN_RE.sub("https://www.bbc.com", url, count=1)
 
-    # Remove fragments
-    url = url.split("#", 1)[0]
-    # Remove query params
-    url = re.sub(r"\?.*$", "", url)
+    # Remove fragments and query params (everything from the first '?' or '#')
+    url = URL_TAIL_RE.sub("", url, count=1)
 
     return url
 
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def is_probably_article_url(url: str) -> bool:
     """
     Strict article URL filter:
@@ -126,16 +209,15 @@ def is_probably_article_url(url: str) -> bool:
     if not url.startswith("https://www.bbc.com/news"):
         return False
 
-    bad_keywords = ["/videos/", "/live/", "/topics/", "/av/", "/in_pictures", "/special/", "/resources/"]
-    if any(k in url for k in bad_keywords):
+    if BAD_URL_RE.search(url):
         return False
 
     # Pattern 1: /news/articles/<id>
-    if re.search(r"^https://www\.bbc\.com/news/articles/[a-z0-9]+$", url):
+    if ARTICLE_URL_RE1.match(url):
         return True
 
     # Pattern 2: /news/<something>/<article_id> where article_id often starts with 'c'
-    if re.search(r"^https://www\.bbc\.com/news/[^/]+/c[a-z0-9]{8,}$", url):
+    if ARTICLE_URL_RE2.match(url):
         return True
 
     return False
@@ -150,23 +232,53 @@ def safe_filename_from_url(url: str) -> str:
 
 def fetch_html(url: str) -> str:
     """Download HTML from a URL and return text. Raises for bad status codes."""
-    headers = {"User-Agent": USER_AGENT}
-    resp = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    RATE_LIMITER.wait()
+    resp = SESSION.get(url, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
     return resp.text
 
 
+_PARSER_LOCAL = threading.local()
+
+
+def get_html_parser() -> lxml.html.HTMLParser:
+    """
+    Return this thread's lxml HTML parser, creating it on first use.
+    Parsers are reused across documents (no per-page setup) but are not
+    thread-safe, so each worker thread gets its own.
+    """
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(remove_blank_text=True, remove_comments=True)
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+def parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse a page once into an lxml tree; blank input gives an empty <html> element."""
+    if not html.strip():
+        return lxml.html.Element("html")
+    return lxml.html.fromstring(html, parser=get_html_parser())
+
+
+def extract_hrefs(root: lxml.html.HtmlElement) -> List[str]:
+    """
+    Return every <a href> value in a parsed page.
+    Uses an lxml XPath query since only the attribute is needed.
+    """
+    return root.xpath("//a/@href")
+
+
 def extract_links_from_section(section_url: str) -> List[str]:
     """
     Fetch a section landing page and extract candidate article links.
     Returns a de-duplicated list of normalized URLs.
     """
     html = fetch_html(section_url)
-    soup = BeautifulSoup(html, "html.parser")
 
     urls: List[str] = []
-    for a in soup.find_all("a", href=True):
-        href = normalize_bbc_url(a["href"])
+    for raw_href in extract_hrefs(parse_html(html)):
+        href = normalize_bbc_url(raw_href)
         if is_probably_article_url(href):
             urls.append(href)
 
@@ -192,62 +304,68 @@ def extract_links_from_bbc_search(query: str, max_pages: int = 10) -> List[str]:
     for page in range(1, max_pages + 1):
         params = {"q": query, "page": page}
         print(f"[SEARCH] q='{query}' page={page}")
-        html = requests.get(base, params=params, headers={"User-Agent": USER_AGENT}, timeout=REQUEST_TIMEOUT).text
-        soup = BeautifulSoup(html, "html.parser")
+        RATE_LIMITER.wait()
+        html = SESSION.get(base, params=params, timeout=REQUEST_TIMEOUT).text
 
         # search results usually contain <a href="..."> to news pages
-        for a in soup.find_all("a", href=True):
-            href = normalize_bbc_url(a["href"])
+        for raw_href in extract_hrefs(parse_html(html)):
+            href = normalize_bbc_url(raw_href)
             if is_probably_article_url(href) and href not in seen:
                 seen.add(href)
                 collected.append(href)
 
-        time.sleep(SLEEP_SECONDS)
-
     return collected
 
 
-def parse_article_page(html: str) -> Tuple[str, Optional[str], str]:
+def element_text(el: lxml.html.HtmlElement, sep: str = "") -> str:
+    """
+    Join the stripped, non-empty text pieces under an element with `sep`
+    (same result as BeautifulSoup's get_text(sep, strip=True)).
+    """
+    pieces = (t.strip() for t in TEXT_NODES_XPATH(el))
+    return sep.join(t for t in pieces if t)
+
+
+def parse_article_page(root: lxml.html.HtmlElement) -> Tuple[str, Optional[str], str]:
     """
-    Parse an article HTML page and return:
+    Parse an article page (already parsed with parse_html) and return:
     (headline, published_at_iso, body_preview)
 
     We try multiple strategies since site HTML can vary.
     """
-    soup = BeautifulSoup(html, "html.parser")
-
     # Headline
     headline = ""
-    h1 = soup.find("h1")
-    if h1 and h1.get_text(strip=True):
-        headline = h1.get_text(strip=True)
+    h1 = root.find(".//h1")
+    if h1 is not None:
+        headline = element_text(h1)
 
     # Publication date
     published_at_iso: Optional[str] = None
-    time_tag = soup.find("time")
-    if time_tag and time_tag.has_attr("datetime"):
-        dt_raw = str(time_tag["datetime"]).strip()
+    time_tag = root.find(".//time")
+    if time_tag is not None and time_tag.get("datetime") is not None:
+        dt_raw = time_tag.get("datetime").strip()
+        # BBC already emits ISO 8601 (e.g. 2025-12-08T11:32:17.223Z). Anything else is
+        # kept as-is and left to clean_data.parse_dates' non-ISO fallback.
         try:
-            published_at_iso = date_parser.parse(dt_raw).isoformat()
-        except Exception:
-            published_at_iso = None
+            published_at_iso = datetime.fromisoformat(dt_raw.replace("Z", "+00:00")).isoformat()
+        except ValueError:
+            published_at_iso = dt_raw or None
 
     # Body text: collect paragraphs inside <article> when possible
     body_texts: List[str] = []
-    article_tag = soup.find("article")
-    if article_tag:
-        ps = article_tag.find_all("p")
-    else:
-        ps = soup.find_all("p")
-
-    for p in ps:
-        txt = p.get_text(" ", strip=True)
+    article_tag = root.find(".//article")
+    scope = article_tag if article_tag is not None else root
+
+    for p in scope.iter("p"):
+        txt = element_text(p, " ")
         # Filter out empty / boilerplate bits
         if txt and len(txt.split()) >= 5:
             body_texts.append(txt)
+            # Keep only the first few paragraphs (preview)
+            if len(body_texts) == 5:
+                break
 
-    # Keep only the first few paragraphs (preview)
-    body_preview = " ".join(body_texts[:5]).strip()
+    body_preview = " ".join(body_texts).strip()
 
     return headline, published_at_iso, body_preview
 
@@ -274,15 +392,42 @@ def looks_like_section_landing(headline: str, body_preview: str) -> bool:
     return False
 
 
-def collect_section_articles(section_name: str, section_url: str) -> List[ArticleRecord]:
+def fetch_article(url: str) -> Tuple[str, str, Optional[str], str]:
+    """
+    Worker task: download and parse one article page.
+    Returns (html, headline, published_at_iso, body_preview).
+    """
+    print(f"[GET] {url}")
+    html = fetch_html(url)
+    headline, published_at_iso, body_preview = parse_article_page(parse_html(html))
+    return html, headline, published_at_iso, body_preview
+
+
+def collect_section_articles(
+    section_name: str,
+    section_url: str,
+    out: TextIO,
+    scraped_urls: Set[str],
+    n_existing: int = 0,
+) -> int:
     """
     Collect articles for a single section:
     - fetch section page
     - extract candidate URLs
-    - fetch each article page until reaching MAX_ARTICLES_PER_SECTION
+    - fetch article pages concurrently (rate limited) until reaching MAX_ARTICLES_PER_SECTION
+    - append each accepted article to `out` as soon as it is validated
+
+    URLs in `scraped_urls` (from a previous run) are skipped, and `n_existing`
+    articles already saved for this section count toward the cap.
+    Returns the number of articles for this section after the run.
     """
     print(f"\n===== Scraping section: {section_name} =====")
 
+    if n_existing >= MAX_ARTICLES_PER_SECTION:
+        # Already full from a previous run: skip the section and search page crawl
+        print(f"[DONE] {section_name}: already has {n_existing} articles (cap {MAX_ARTICLES_PER_SECTION})")
+        return n_existing
+
     candidate_urls = extract_links_from_section(section_url)
 
     # Expand using BBC search (to reach enough articles)
@@ -296,7 +441,7 @@ def collect_section_articles(section_name: str, section_url: str) -> List[Articl
     merged: List[str] = []
     seen_merge: Set[str] = set()
     for u in candidate_urls + search_urls:
-        if u not in seen_merge:
+        if u not in seen_merge and u not in scraped_urls:
             seen_merge.add(u)
             merged.append(u)
 
@@ -304,83 +449,111 @@ def collect_section_articles(section_name: str, section_url: str) -> List[Articl
     print(f"[INFO] Expanded candidate URLs (section+search): {len(candidate_urls)}")
     print(f"[INFO] Found {len(candidate_urls)} candidate article URLs")
 
-    records: List[ArticleRecord] = []
-    visited: Set[str] = set()
+    n_collected = n_existing
+    pending: Dict[Future, str] = {}
+    url_iter = iter(candidate_urls)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        while True:
+            # Keep at most MAX_WORKERS downloads in flight; stop feeding once the cap is hit
+            while len(pending) < MAX_WORKERS and n_collected < MAX_ARTICLES_PER_SECTION:
+                next_url = next(url_iter, None)
+                if next_url is None:
+                    break
+                pending[executor.submit(fetch_article, next_url)] = next_url
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = pending.pop(future)
+                if n_collected >= MAX_ARTICLES_PER_SECTION:
+                    continue
+
+                try:
+                    html, headline, published_at_iso, body_preview = future.result()
+
+                    if looks_like_section_landing(headline, body_preview):
+                        print(f"[SKIP] Not an article / too short: {headline[:50]}")
+                        continue
+
+                    raw_path = save_raw_html(url, html)
+
+                    rec = ArticleRecord(
+                        url=url,
+                        section=section_name,
+                        published_at=published_at_iso,
+                        headline=headline,
+                        body_preview=body_preview,
+                        raw_html_path=str(raw_path.relative_to(PROJECT_ROOT)),
+                    )
+                    append_metadata_row(out, rec)
+                    scraped_urls.add(url)
+                    n_collected += 1
+                    print(f"[OK] Saved: {headline[:60]}")
+
+                except requests.HTTPError as e:
+                    print(f"[ERROR] HTTP error for {url}: {e}")
+                except requests.RequestException as e:
+                    print(f"[ERROR] Request error for {url}: {e}")
+                except Exception as e:
+                    print(f"[ERROR] Unexpected error for {url}: {e}")
+
+    print(f"[DONE] {section_name}: collected {n_collected - n_existing} new articles ({n_collected} total)")
+    return n_collected
+
+
+def load_existing_metadata() -> Tuple[Set[str], Counter]:
+    """
+    Read data/raw/metadata.csv from a previous (possibly interrupted) run.
+    Returns the URLs already scraped and the number of rows saved per section
+    (counted row by row, as the cap was applied); both empty if there is nothing to resume.
+    """
+    urls: Set[str] = set()
+    per_section: Counter = Counter()
+    if not METADATA_PATH.exists():
+        return urls, per_section
+    with METADATA_PATH.open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            urls.add(row["url"])
+            per_section[row["section"]] += 1
+    return urls, per_section
 
-    for url in candidate_urls:
-        if url in visited:
-            continue
-        visited.add(url)
 
-        if len(records) >= MAX_ARTICLES_PER_SECTION:
-            break
+def open_metadata_csv() -> TextIO:
+    """Open data/raw/metadata.csv for appending, writing the header if the file is new."""
+    is_new = not METADATA_PATH.exists() or METADATA_PATH.stat().st_size == 0
+    f = METADATA_PATH.open("a", newline="", encoding="utf-8")
+    if is_new:
+        csv.DictWriter(f, fieldnames=METADATA_FIELDS, lineterminator="\n").writeheader()
+        f.flush()
+    return f
 
-        try:
-            print(f"[GET] {url}")
-            html = fetch_html(url)
-            headline, published_at_iso, body_preview = parse_article_page(html)
-
-            if looks_like_section_landing(headline, body_preview):
-                print(f"[SKIP] Not an article / too short: {headline[:50]}")
-                continue
-
-            raw_path = save_raw_html(url, html)
-
-            rec = ArticleRecord(
-                url=url,
-                section=section_name,
-                published_at=published_at_iso,
-                headline=headline,
-                body_preview=body_preview,
-                raw_html_path=str(raw_path.relative_to(PROJECT_ROOT)),
-            )
-            records.append(rec)
-            print(f"[OK] Saved: {headline[:60]}")
-
-            time.sleep(SLEEP_SECONDS)
-
-        except requests.HTTPError as e:
-            print(f"[ERROR] HTTP error for {url}: {e}")
-        except requests.RequestException as e:
-            print(f"[ERROR] Request error for {url}: {e}")
-        except Exception as e:
-            print(f"[ERROR] Unexpected error for {url}: {e}")
-
-    print(f"[DONE] {section_name}: collected {len(records)} articles")
-    return records
-
-
-def write_metadata_csv(records: List[ArticleRecord]) -> None:
-    """Write metadata records to data/raw/metadata.csv."""
-    rows = []
-    for r in records:
-        rows.append(
-            {
-                "url": r.url,
-                "section": r.section,
-                "published_at": r.published_at,
-                "headline": r.headline,
-                "body_preview": r.body_preview,
-                "raw_html_path": r.raw_html_path,
-            }
-        )
-
-    df = pd.DataFrame(rows)
-    df.to_csv(METADATA_PATH, index=False, encoding="utf-8")
-    print(f"\n[WRITE] Metadata CSV saved to: {METADATA_PATH.relative_to(PROJECT_ROOT)}")
-    print(f"[INFO] Total rows: {len(df)}")
+
+def append_metadata_row(f: TextIO, rec: ArticleRecord) -> None:
+    """Append one record and flush, so a crash mid-run keeps everything saved so far."""
+    csv.DictWriter(f, fieldnames=METADATA_FIELDS, lineterminator="\n").writerow(asdict(rec))
+    f.flush()
 
 
 def main() -> None:
     """Main entry point for scraping all sections and saving outputs."""
     ensure_dirs()
 
-    all_records: List[ArticleRecord] = []
-    for section_name, section_url in SECTIONS.items():
-        recs = collect_section_articles(section_name, section_url)
-        all_records.extend(recs)
+    scraped_urls, existing_per_section = load_existing_metadata()
+    if existing_per_section:
+        n_rows = sum(existing_per_section.values())
+        print(f"[RESUME] {n_rows} articles already in {METADATA_PATH.relative_to(PROJECT_ROOT)}")
+
+    total = 0
+    with open_metadata_csv() as out:
+        for section_name, section_url in SECTIONS.items():
+            n_existing = existing_per_section[section_name]
+            total += collect_section_articles(section_name, section_url, out, scraped_urls, n_existing)
 
-    write_metadata_csv(all_records)
+    print(f"\n[WRITE] Metadata CSV saved to: {METADATA_PATH.relative_to(PROJECT_ROOT)}")
+    print(f"[INFO] Total rows: {total}")
     print("\n✅ Scraping completed successfully.")
 
 
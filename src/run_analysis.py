@@ -6,10 +6,11 @@ Compute VADER sentiment for BBC news headlines vs body text and summarize result
 Input:
 - data/processed/articles_clean.csv
 
-Output:
+Output (each CSV also gets a .parquet sibling, which visualize_results.py prefers):
 - data/processed/articles_with_sentiment.csv
 - results/summary_section.csv
 - results/summary_time.csv
+- results/summary_label_props.csv
 
 Usage (from project root):
     python src/run_analysis.py
@@ -17,11 +18,19 @@ Usage (from project root):
 
 from __future__ import annotations
 
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pa_csv
 
 # We use NLTK's VADER implementation (downloads vader_lexicon automatically if missing)
 import nltk
@@ -41,10 +50,27 @@ RAW_DIR = PROJECT_ROOT / "data" / "raw"
 RESULTS_DIR = PROJECT_ROOT / "results"
 
 INPUT_CLEAN = PROCESSED_DIR / "articles_clean.csv"
+# Columns read from INPUT_CLEAN (anything else, e.g. raw_html_path, is not needed here)
+CLEAN_COLUMNS = ["url", "section", "published_at", "published_date", "headline", "body_preview"]
 
 OUTPUT_WITH_SENTIMENT = PROCESSED_DIR / "articles_with_sentiment.csv"
 OUTPUT_SECTION_SUMMARY = RESULTS_DIR / "summary_section.csv"
 OUTPUT_TIME_SUMMARY = RESULTS_DIR / "summary_time.csv"
+OUTPUT_LABEL_PROPS = RESULTS_DIR / "summary_label_props.csv"
+
+# Parsed VADER lexicon, cached so later runs skip re-parsing vader_lexicon.txt
+# (a disposable local cache: git-ignored, rebuilt whenever missing or unreadable)
+VADER_LEX_CACHE = PROCESSED_DIR / "vader_lex.pkl"
+
+# Category order matches label_sentiment's codes
+SENTIMENT_LABELS = ["negative", "neutral", "positive"]
+
+# VADER scoring is spread over a process pool once there are enough distinct texts
+N_WORKERS = os.cpu_count() or 1
+PARALLEL_MIN_TEXTS = 2000
+
+# articles_clean.csv is streamed in blocks of this many bytes (one chunk in memory at a time)
+CHUNK_BYTES = 64 << 20
 
 
 def ensure_dirs() -> None:
@@ -53,51 +79,234 @@ def ensure_dirs() -> None:
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+class _CachedLexiconAnalyzer(SentimentIntensityAnalyzer):
+    """
+    SentimentIntensityAnalyzer built through its normal __init__, except that
+    make_lex_dict returns an already-parsed lexicon instead of re-parsing the file.
+    """
+
+    def __init__(self, lexicon: Dict[str, float]) -> None:
+        self._cached_lexicon = lexicon
+        super().__init__()
+
+    def make_lex_dict(self) -> Dict[str, float]:
+        return self._cached_lexicon
+
+
+def load_lexicon_cache() -> Optional[Dict[str, float]]:
+    """
+    Return the lexicon pickled in VADER_LEX_CACHE, or None if there is no cache, it
+    was written by another NLTK version, or it is unreadable (e.g. truncated).
+    """
+    if not VADER_LEX_CACHE.exists():
+        return None
+    try:
+        with VADER_LEX_CACHE.open("rb") as f:
+            nltk_version, lexicon = pickle.load(f)
+    except (EOFError, pickle.UnpicklingError, ValueError) as e:
+        print(f"[WARN] Ignoring unreadable {VADER_LEX_CACHE.name} ({e}); rebuilding it")
+        return None
+    return lexicon if nltk_version == nltk.__version__ else None
+
+
+def save_lexicon_cache(lexicon: Dict[str, float]) -> None:
+    """Pickle `lexicon` to VADER_LEX_CACHE atomically (temp file + os.replace)."""
+    VADER_LEX_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = VADER_LEX_CACHE.with_name(f"{VADER_LEX_CACHE.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump((nltk.__version__, lexicon), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, VADER_LEX_CACHE)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 def init_vader() -> SentimentIntensityAnalyzer:
     """
     Initialize NLTK VADER sentiment analyzer.
+    The parsed lexicon dict is pickled to VADER_LEX_CACHE (tagged with the NLTK
+    version) on first use; later runs load it instead of re-parsing the lexicon file.
     """
     try:
         # Ensure lexicon exists
         nltk.data.find("sentiment/vader_lexicon.zip")
     except LookupError:
         nltk.download("vader_lexicon")
-    return SentimentIntensityAnalyzer()
+
+    lexicon = load_lexicon_cache()
+    if lexicon is not None:
+        return _CachedLexiconAnalyzer(lexicon)
+
+    sia = SentimentIntensityAnalyzer()
+    save_lexicon_cache(sia.lexicon)
+    return sia
+
+
+@dataclass(frozen=True)
+class LexiconFilter:
+    """
+    Cheap, exact pre-check for VADER: can_score(text) is False only when no token of
+    `text` can reach a lexicon entry, in which case VADER's compound is exactly 0.0.
+
+    SentiText turns a whitespace token w into w itself, or w minus one leading or
+    trailing PUNC_LIST mark; only a lowercased lexicon hit gives non-zero valence.
+    Marks consist of PUNC_LIST characters, so stripping those characters from both
+    ends of (mark + entry) or (entry + mark) gives the same as stripping the entry.
+    A text therefore needs a token in `entries`, or a token whose stripped form is in
+    `stripped`. Entries made only of those characters strip to "", so their marked
+    forms are added to `entries` directly.
+    """
+
+    entries: frozenset
+    stripped: frozenset
+    edge_punc: "re.Pattern[str]"
+
+    @classmethod
+    def from_analyzer(cls, sia: SentimentIntensityAnalyzer) -> "LexiconFilter":
+        punc = sia.constants.PUNC_LIST
+        chars = "".join(sorted(set("".join(punc))))
+        entries = set(sia.lexicon)
+        stripped = set()
+        for word in sia.lexicon:
+            core = word.strip(chars)
+            if core:
+                stripped.add(core)
+            else:
+                entries.update(p + word for p in punc)
+                entries.update(word + p for p in punc)
+        # Runs of those characters at the start or end of a whitespace token
+        cls_ = re.escape(chars)
+        edge_punc = re.compile(rf"(?<!\S)[{cls_}]+|[{cls_}]+(?!\S)")
+        return cls(frozenset(entries), frozenset(stripped), edge_punc)
+
+    def can_score(self, text: str) -> bool:
+        lowered = text.lower()
+        return not self.entries.isdisjoint(lowered.split()) or not self.stripped.isdisjoint(
+            self.edge_punc.sub("", lowered).split()
+        )
+
+
+# (lexicon, LexiconFilter) for the last analyzer seen; built lazily by lexicon_filter
+_LEX_FILTER: Optional[Tuple[dict, LexiconFilter]] = None
+
+
+def lexicon_filter(sia: SentimentIntensityAnalyzer) -> LexiconFilter:
+    """The LexiconFilter for `sia`'s lexicon, built once per lexicon (a few ms)."""
+    global _LEX_FILTER
+    if _LEX_FILTER is None or _LEX_FILTER[0] is not sia.lexicon:
+        _LEX_FILTER = (sia.lexicon, LexiconFilter.from_analyzer(sia))
+    return _LEX_FILTER[1]
+
+
+def compound_scores(sia: SentimentIntensityAnalyzer, texts: np.ndarray) -> np.ndarray:
+    """
+    VADER compound score for each string in `texts`; empty text scores 0.0.
+    Texts with no token that can match the lexicon (see LexiconFilter) also score
+    exactly 0.0 in VADER, so they skip the full polarity_scores pass.
+    """
+    polarity_scores = sia.polarity_scores  # bound once, not looked up per text
+    can_score = lexicon_filter(sia).can_score
+    return np.fromiter(
+        (polarity_scores(t)["compound"] if t and can_score(t) else 0.0 for t in texts),
+        dtype=np.float64,
+        count=len(texts),
+    )
+
+
+# Analyzer used by process-pool workers. score_texts sets it in the parent before
+# starting the pool, so forked workers inherit it copy-on-write; under spawn each
+# worker builds its own once in _init_worker. Tasks never carry the lexicon.
+_SIA: Optional[SentimentIntensityAnalyzer] = None
+
+
+def _init_worker() -> None:
+    global _SIA
+    if _SIA is None:
+        _SIA = init_vader()
+
+
+def _score_chunk(texts: np.ndarray) -> np.ndarray:
+    """
+    Process-pool task: score `texts` with the worker's module-level analyzer.
+    """
+    return compound_scores(_SIA, texts)
 
 
-def vader_compound(sia: SentimentIntensityAnalyzer, text: str) -> float:
+def score_texts(sia: SentimentIntensityAnalyzer, texts: pd.Series) -> np.ndarray:
     """
-    Return VADER compound score in [-1, 1].
+    VADER compound score for every string in `texts` (already filled / cast to str).
+    Each distinct text is scored once (re-posts, wire copies and empty strings
+    repeat) and the scores are gathered back by position. Large inputs are
+    split across N_WORKERS processes.
     """
-    if text is None:
-        text = ""
-    text = str(text).strip()
-    if not text:
-        return 0.0
-    return float(sia.polarity_scores(text)["compound"])
+    global _SIA
+    codes, uniques = pd.factorize(texts.to_numpy())
+    if N_WORKERS > 1 and len(uniques) >= PARALLEL_MIN_TEXTS:
+        chunks = np.array_split(uniques, N_WORKERS)
+        # Build the lexicon filter here too, so forked workers inherit it along with _SIA
+        _SIA = sia
+        lexicon_filter(sia)
+        with ProcessPoolExecutor(max_workers=N_WORKERS, initializer=_init_worker) as ex:
+            unique_scores = np.concatenate(list(ex.map(_score_chunk, chunks)))
+    else:
+        unique_scores = compound_scores(sia, uniques)
+    return unique_scores[codes]
 
 
-def label_sentiment(compound: float) -> str:
+def label_sentiment(compound: pd.Series) -> pd.Categorical:
     """
-    Standard VADER thresholds:
+    Standard VADER thresholds, applied to a whole column at once:
       compound >= 0.05 -> positive
       compound <= -0.05 -> negative
       else -> neutral
+    Codes are (c >= 0.05) + (c > -0.05), i.e. 0/1/2 for negative/neutral/positive.
     """
-    if compound >= 0.05:
-        return "positive"
-    if compound <= -0.05:
-        return "negative"
-    return "neutral"
+    c = compound.to_numpy()
+    codes = (c >= 0.05).astype(np.int8) + (c > -0.05).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=SENTIMENT_LABELS)
 
 
-def load_clean() -> pd.DataFrame:
+def iter_clean_chunks() -> Iterator[pd.DataFrame]:
+    """
+    Stream INPUT_CLEAN as DataFrames of roughly CHUNK_BYTES of CSV each, so peak
+    memory stays at one chunk however large the cleaned file grows. Always yields
+    at least one (possibly empty) frame.
+    """
     if not INPUT_CLEAN.exists():
         raise FileNotFoundError(f"Missing cleaned file: {INPUT_CLEAN}")
 
-    df = pd.read_csv(INPUT_CLEAN)
-    print(f"[LOAD] Cleaned rows: {len(df)}")
-    return df
+    # Arrow's streaming parser, only the needed columns, Arrow-backed strings.
+    # Every column is pinned to string: dates are parsed by coerce_dates, and a block
+    # that happens to be all-null cannot change the type mid-stream.
+    header = pd.read_csv(INPUT_CLEAN, nrows=0).columns
+    columns = [c for c in CLEAN_COLUMNS if c in header]
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=columns,
+        column_types={c: pa.string() for c in columns},
+        strings_can_be_null=True,
+    )
+    read_options = pa_csv.ReadOptions(block_size=CHUNK_BYTES)
+    # Scraped headlines/bodies can hold quoted newlines; without this, Arrow splits
+    # blocks inside such a value and loses sync on any file larger than one block
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+
+    def to_frame(batch: pa.RecordBatch) -> pd.DataFrame:
+        df = batch.to_pandas(types_mapper=pd.ArrowDtype)
+        # Few distinct sections: categorical codes make every later groupby/value_counts cheap
+        df["section"] = df["section"].astype("category")
+        return df
+
+    n_rows = 0
+    with pa_csv.open_csv(
+        INPUT_CLEAN, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+    ) as reader:
+        for batch in reader:
+            n_rows += batch.num_rows
+            yield to_frame(batch)
+        if not n_rows:
+            # Header-only file: still hand downstream one empty, correctly typed frame
+            yield to_frame(pa.RecordBatch.from_pylist([], schema=reader.schema))
+    print(f"[LOAD] Cleaned rows: {n_rows}")
 
 
 def coerce_dates(df: pd.DataFrame) -> pd.DataFrame:
@@ -105,7 +314,7 @@ def coerce_dates(df: pd.DataFrame) -> pd.DataFrame:
     Normalize dates. We prefer published_date if available; fall back to published_at.
     Adds:
       - published_dt (datetime64)
-      - date (YYYY-MM-DD string)
+      - date (datetime64 at day resolution; written out as YYYY-MM-DD)
     """
     # Prefer published_date (your clean_data already created it)
     if "published_date" in df.columns:
@@ -115,13 +324,12 @@ def coerce_dates(df: pd.DataFrame) -> pd.DataFrame:
     else:
         raise ValueError("No published_date or published_at column found.")
 
-    df = df.copy()
     df["published_dt"] = dt
-    df = df.dropna(subset=["published_dt"])
-
-    # Convert to date string (YYYY-MM-DD)
-    df["date"] = df["published_dt"].dt.strftime("%Y-%m-%d")
-    return df
+    # Day bucket kept as datetime64 (cheap to group on; to_csv prints midnight-only
+    # timestamps as YYYY-MM-DD, and Parquet keeps the dtype for the visualizer).
+    # Added before the dropna so no column is ever set on the filtered result.
+    df["date"] = dt.dt.floor("D")
+    return df.dropna(subset=["published_dt"])
 
 
 def apply_event_window(df: pd.DataFrame, cfg: Config) -> pd.DataFrame:
@@ -131,9 +339,8 @@ def apply_event_window(df: pd.DataFrame, cfg: Config) -> pd.DataFrame:
     start = pd.to_datetime(cfg.start_date)
     end = pd.to_datetime(cfg.end_date)
 
-    df = df.copy()
-    df = df[(df["published_dt"] >= start) & (df["published_dt"] <= end)]
-    return df
+    # main() rebinds df to the result, so the selection needs no defensive copy
+    return df.loc[(df["published_dt"] >= start) & (df["published_dt"] <= end)]
 
 
 def compute_sentiment(df: pd.DataFrame, sia: SentimentIntensityAnalyzer) -> pd.DataFrame:
@@ -143,9 +350,10 @@ def compute_sentiment(df: pd.DataFrame, sia: SentimentIntensityAnalyzer) -> pd.D
       - headline_compound, headline_label
       - body_compound, body_label
       - headline_minus_body
+    Scores are stored as float32 (VADER compounds have 4 decimals) and labels as
+    int8-coded categoricals; headline_minus_body is taken from the float64 scores so
+    it carries no float32 rounding. The caller's frame is extended in place.
     """
-    df = df.copy()
-
     # Safety: ensure text columns exist
     if "headline" not in df.columns:
         df["headline"] = ""
@@ -155,108 +363,245 @@ def compute_sentiment(df: pd.DataFrame, sia: SentimentIntensityAnalyzer) -> pd.D
     df["headline"] = df["headline"].fillna("").astype(str)
     df["body_preview"] = df["body_preview"].fillna("").astype(str)
 
-    df["headline_compound"] = df["headline"].apply(lambda x: vader_compound(sia, x))
-    df["body_compound"] = df["body_preview"].apply(lambda x: vader_compound(sia, x))
+    headline = score_texts(sia, df["headline"])
+    body = score_texts(sia, df["body_preview"])
+    df["headline_compound"] = headline.astype(np.float32)
+    df["body_compound"] = body.astype(np.float32)
 
-    df["headline_label"] = df["headline_compound"].apply(label_sentiment)
-    df["body_label"] = df["body_compound"].apply(label_sentiment)
+    df["headline_label"] = label_sentiment(df["headline_compound"])
+    df["body_label"] = label_sentiment(df["body_compound"])
 
-    df["headline_minus_body"] = df["headline_compound"] - df["body_compound"]
+    df["headline_minus_body"] = headline - body
 
     return df
 
 
-def write_outputs(df: pd.DataFrame) -> None:
-    df.to_csv(OUTPUT_WITH_SENTIMENT, index=False)
-    print(f"[WRITE] {OUTPUT_WITH_SENTIMENT.relative_to(PROJECT_ROOT)}")
+def write_table(df: pd.DataFrame, csv_path: Path) -> None:
+    """
+    Write `df` as CSV (human-readable) and as a Snappy Parquet sibling
+    (typed, compact, fast to reload for the visualizer).
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    df.to_csv(csv_path, index=False)
+    df.to_parquet(parquet_path, compression="snappy", index=False)
+    print(f"[WRITE] {csv_path.relative_to(PROJECT_ROOT)} (+ {parquet_path.name})")
+
+
+class ChunkedTableWriter:
+    """
+    Append DataFrame chunks to a CSV and its Snappy Parquet sibling (same layout as
+    write_table). Each chunk becomes one Parquet row group; the Arrow schema is
+    fixed by the first non-empty chunk written. If no rows arrive at all, close()
+    still writes empty tables.
+    """
+
+    def __init__(self, csv_path: Path) -> None:
+        self.csv_path = csv_path
+        self.parquet_path = csv_path.with_suffix(".parquet")
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._schema: Optional[pa.Schema] = None
+        self._empty: Optional[pd.DataFrame] = None
+        self.n_rows = 0
+
+    def write(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            # Empty text columns carry no Arrow type yet, so an empty chunk cannot fix
+            # the schema; it is only kept in case nothing else is ever written
+            if self._writer is None:
+                self._empty = df
+            return
+        if self._writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(self.parquet_path, self._schema, compression="snappy")
+            df.to_csv(self.csv_path, index=False)
+        else:
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            df.to_csv(self.csv_path, mode="a", header=False, index=False)
+        self._writer.write_table(table)
+        self.n_rows += len(df)
+
+    def close(self) -> None:
+        if self._writer is None:
+            if self._empty is not None:
+                write_table(self._empty, self.csv_path)
+            return
+        self._writer.close()
+        print(f"[WRITE] {self.csv_path.relative_to(PROJECT_ROOT)} (+ {self.parquet_path.name}): {self.n_rows} rows")
+
+    def __enter__(self) -> "ChunkedTableWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def partial_stats(df: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """
+    Per-group row count, sum and sum of squared deviations (M2) of the compound
+    scores for one chunk, in float64. combine_stats merges the partials of every
+    chunk, so the summaries never need all articles in memory at once.
+    """
+    # Compounds are VADER scores rounded to 4 decimals; rounding the widened float32
+    # recovers the exact float64 values, so no float32 noise reaches the summaries
+    frame = pd.DataFrame(
+        {
+            **{k: df[k] for k in keys},
+            "headline": df["headline_compound"].to_numpy(dtype=np.float64).round(4),
+            "body": df["body_compound"].to_numpy(dtype=np.float64).round(4),
+        }
+    )
+    g = frame.groupby(keys, observed=True)
+    stats = pd.DataFrame({"n_articles": g.size()})
+    for col in ("headline", "body"):
+        stats[f"sum_{col}"] = g[col].sum()
+        stats[f"m2_{col}"] = g[col].var(ddof=0) * stats["n_articles"]
+    return stats
+
+
+def combine_stats(parts: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Merge per-chunk partial_stats. Counts and sums add up; M2 of the union is the
+    parts' M2 plus each part's n * (part mean - overall mean)^2, which stays exact
+    where summing raw squares would cancel.
+    """
+    stats = pd.concat(parts)
+    levels = list(range(stats.index.nlevels))
+    total = stats.groupby(level=levels, observed=True)[["n_articles", "sum_headline", "sum_body"]].sum()
+    for col in ("headline", "body"):
+        mean = stats[f"sum_{col}"] / stats["n_articles"]
+        overall = (total[f"sum_{col}"] / total["n_articles"]).reindex(stats.index)
+        m2 = stats[f"m2_{col}"] + stats["n_articles"] * (mean - overall) ** 2
+        total[f"m2_{col}"] = m2.groupby(level=levels, observed=True).sum()
+    return total
+
+
+def _std(n: pd.Series, m2: pd.Series) -> pd.Series:
+    """Sample standard deviation (ddof=1, like pandas) from n and M2; NaN for n < 2."""
+    return np.sqrt(m2 / (n - 1)).where(n > 1)
 
 
-def summarize_by_section(df: pd.DataFrame) -> pd.DataFrame:
+def summarize_by_section(stats: pd.DataFrame) -> pd.DataFrame:
     """
     Section-level summary for proposal questions:
       - avg headline sentiment
       - avg body sentiment
       - delta headline-body
       - counts
+    `stats` holds the per-section running sums from partial_stats/combine_stats.
     """
-    if "section" not in df.columns:
-        raise ValueError("Missing column: section")
-
-    sec = (
-        df.groupby("section")
-        .agg(
-            n_articles=("url", "count"),
-            mean_headline=("headline_compound", "mean"),
-            mean_body=("body_compound", "mean"),
-            mean_delta=("headline_minus_body", "mean"),
-            std_headline=("headline_compound", "std"),
-            std_body=("body_compound", "std"),
-        )
-        .reset_index()
-        .sort_values("n_articles", ascending=False)
+    n = stats["n_articles"]
+    sec = pd.DataFrame(
+        {
+            "n_articles": n,
+            "mean_headline": stats["sum_headline"] / n,
+            "mean_body": stats["sum_body"] / n,
+            "std_headline": _std(n, stats["m2_headline"]),
+            "std_body": _std(n, stats["m2_body"]),
+        }
     )
-    sec.to_csv(OUTPUT_SECTION_SUMMARY, index=False)
-    print(f"[WRITE] {OUTPUT_SECTION_SUMMARY.relative_to(PROJECT_ROOT)}")
+    # mean(headline - body) == mean(headline) - mean(body): derive it from the per-group means
+    sec.insert(3, "mean_delta", sec["mean_headline"] - sec["mean_body"])
+    sec = sec.reset_index().sort_values("n_articles", ascending=False)
+    write_table(sec, OUTPUT_SECTION_SUMMARY)
     return sec
 
 
-def summarize_by_time(df: pd.DataFrame) -> pd.DataFrame:
+def summarize_by_time(stats: pd.DataFrame) -> pd.DataFrame:
     """
     Time-series summary (daily) within each section:
       - mean headline, mean body, mean delta
       - n articles
+    `stats` holds the per-(date, section) running sums from partial_stats/combine_stats.
     """
-    t = (
-        df.groupby(["date", "section"])
-        .agg(
-            n_articles=("url", "count"),
-            mean_headline=("headline_compound", "mean"),
-            mean_body=("body_compound", "mean"),
-            mean_delta=("headline_minus_body", "mean"),
-        )
-        .reset_index()
-        .sort_values(["section", "date"])
+    n = stats["n_articles"]
+    t = pd.DataFrame(
+        {
+            "n_articles": n,
+            "mean_headline": stats["sum_headline"] / n,
+            "mean_body": stats["sum_body"] / n,
+        }
     )
-    t.to_csv(OUTPUT_TIME_SUMMARY, index=False)
-    print(f"[WRITE] {OUTPUT_TIME_SUMMARY.relative_to(PROJECT_ROOT)}")
+    t["mean_delta"] = t["mean_headline"] - t["mean_body"]
+    t = t.reset_index().sort_values(["section", "date"])
+    write_table(t, OUTPUT_TIME_SUMMARY)
     return t
 
 
-def print_quick_checks(df: pd.DataFrame) -> None:
+def summarize_label_props(counts: Dict[str, pd.Series]) -> pd.DataFrame:
+    """
+    Sentiment label proportions per section (rows sum to 1), for headlines and bodies
+    stacked under a `which` column. This is exactly what Fig 4 plots, so the visualizer
+    never has to reload the article-level table for it.
+    """
+    props = {}
+    for which in ("headline", "body"):
+        c = counts[f"section_{which}_label"].unstack(fill_value=0)
+        c = c.reindex(columns=[label for label in SENTIMENT_LABELS if label in c.columns])
+        props[which] = c.div(c.sum(axis=1), axis=0)
+
+    lp = pd.concat(props, names=["which"]).reset_index()
+    lp.columns.name = None
+    write_table(lp, OUTPUT_LABEL_PROPS)
+    return lp
+
+
+def accumulate_counts(counts: Dict[str, pd.Series], key: str, vc: pd.Series) -> None:
+    """Fold one chunk's counts into the running totals stored under `key`."""
+    vc = vc.astype(np.int64)
+    counts[key] = vc if key not in counts else counts[key].add(vc, fill_value=0).astype(np.int64)
+
+
+def print_quick_checks(counts: Dict[str, pd.Series]) -> None:
     print("\n[CHECK] Headline sentiment label distribution (overall):")
-    print(df["headline_label"].value_counts(dropna=False))
+    print(counts["headline_label"].sort_values(ascending=False))
 
     print("\n[CHECK] Body sentiment label distribution (overall):")
-    print(df["body_label"].value_counts(dropna=False))
+    print(counts["body_label"].sort_values(ascending=False))
 
     # how many sections, how many rows
-    if "section" in df.columns:
+    if "section" in counts:
         print("\n[CHECK] Articles per section:")
-        print(df["section"].value_counts())
+        print(counts["section"].sort_values(ascending=False))
 
 
 def main() -> None:
     cfg = Config()
     ensure_dirs()
 
-    df = load_clean()
-    df = coerce_dates(df)
+    sia = init_vader()
 
-    # Event window: election aftermath
-    df = apply_event_window(df, cfg)
-    print(f"[STEP] After event window {cfg.start_date} to {cfg.end_date}: {len(df)}")
+    # One pass over the cleaned file, a chunk at a time: score it, append it to the
+    # enriched outputs, and fold it into the running group sums and label counts.
+    section_parts: List[pd.DataFrame] = []
+    time_parts: List[pd.DataFrame] = []
+    counts: Dict[str, pd.Series] = {}
+    with ChunkedTableWriter(OUTPUT_WITH_SENTIMENT) as writer:
+        for df in iter_clean_chunks():
+            df = coerce_dates(df)
 
-    sia = init_vader()
-    df = compute_sentiment(df, sia)
+            # Event window: election aftermath
+            df = apply_event_window(df, cfg)
+            df = compute_sentiment(df, sia)
+
+            # Save enriched dataset (an empty window still yields empty outputs)
+            writer.write(df)
+
+            section_parts.append(partial_stats(df, ["section"]))
+            time_parts.append(partial_stats(df, ["date", "section"]))
+            accumulate_counts(counts, "section", df["section"].value_counts())
+            for col in ("headline_label", "body_label"):
+                accumulate_counts(counts, col, df[col].value_counts())
+                accumulate_counts(counts, f"section_{col}", df.groupby(["section", col], observed=True).size())
 
-    # Save enriched dataset
-    write_outputs(df)
+    print(f"[STEP] After event window {cfg.start_date} to {cfg.end_date}: {writer.n_rows}")
 
     # Summaries used for visualization + report
-    summarize_by_section(df)
-    summarize_by_time(df)
+    summarize_by_section(combine_stats(section_parts))
+    summarize_by_time(combine_stats(time_parts))
+    summarize_label_props(counts)
 
-    print_quick_checks(df)
+    print_quick_checks(counts)
     print("\n[DONE] Analysis completed.")
 
 
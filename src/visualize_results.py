@@ -3,10 +3,11 @@ visualize_results.py
 
 Create visualizations for BBC news sentiment analysis (headline vs body).
 
-Input:
+Input (the .parquet sibling written by run_analysis.py is used when present):
 - data/processed/articles_with_sentiment.csv
 - results/summary_section.csv
 - results/summary_time.csv
+- results/summary_label_props.csv (optional; Fig 4 falls back to the article table)
 
 Output (PNG files in results/):
 - fig1_articles_per_section.png
@@ -22,8 +23,14 @@ Usage (from project root):
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Tuple
 
 import pandas as pd
+import matplotlib
+
+# Render straight to PNG: no GUI backend probing (headless runs, CI)
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
@@ -35,44 +42,85 @@ RESULTS_DIR = PROJECT_ROOT / "results"
 INPUT_ARTICLES = PROCESSED_DIR / "articles_with_sentiment.csv"
 INPUT_SECTION_SUMMARY = RESULTS_DIR / "summary_section.csv"
 INPUT_TIME_SUMMARY = RESULTS_DIR / "summary_time.csv"
+INPUT_LABEL_PROPS = RESULTS_DIR / "summary_label_props.csv"
+
+# Matplotlib's default figure size, for the plots that do not set their own
+DEFAULT_FIGSIZE = tuple(plt.rcParams["figure.figsize"])
+SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
 
 
 def ensure_dirs() -> None:
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def save_fig(filename: str) -> None:
+def load_label_props(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Headline and body label proportions per section (rows sum to 1) for Fig 4.
+    Uses the table precomputed by run_analysis.py when present; outputs from older
+    runs do not have it, so it is then recomputed from the article-level table.
+    """
+    if INPUT_LABEL_PROPS.with_suffix(".parquet").exists() or INPUT_LABEL_PROPS.exists():
+        props = load_table(INPUT_LABEL_PROPS).set_index(["which", "section"])
+        return props.loc["headline"], props.loc["body"]
+
+    sections = sorted(df["section"].unique())
+    headline_props = pd.crosstab(df["section"], df["headline_label"], normalize="index").reindex(index=sections)
+    body_props = pd.crosstab(df["section"], df["body_label"], normalize="index").reindex(index=sections)
+    return headline_props, body_props
+
+
+def load_table(csv_path: Path) -> pd.DataFrame:
+    """
+    Load a run_analysis.py output, preferring its Parquet sibling (typed, no re-parsing)
+    and falling back to the CSV.
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path)
+    if csv_path.exists():
+        return pd.read_csv(csv_path)
+    raise FileNotFoundError(f"Missing: {csv_path}")
+
+
+def start_fig(fig: plt.Figure, figsize: tuple = DEFAULT_FIGSIZE) -> None:
+    """
+    Prepare the shared figure for the next plot (save_fig leaves it cleared): resize it
+    and undo the previous tight_layout's margins, so each plot lays out as if fresh.
+    """
+    fig.set_size_inches(figsize)
+    fig.subplots_adjust(**{k: plt.rcParams[f"figure.subplot.{k}"] for k in SUBPLOT_PARAMS})
+
+
+def save_fig(fig: plt.Figure, filename: str) -> None:
     out_path = RESULTS_DIR / filename
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=200)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=200)
+    # Reuse the same Figure (and its canvas/renderer) for the next plot
+    fig.clear()
     print(f"[SAVE] {out_path.relative_to(PROJECT_ROOT)}")
 
 
 def main() -> None:
     ensure_dirs()
 
-    if not INPUT_ARTICLES.exists():
-        raise FileNotFoundError(f"Missing: {INPUT_ARTICLES}")
-    if not INPUT_SECTION_SUMMARY.exists():
-        raise FileNotFoundError(f"Missing: {INPUT_SECTION_SUMMARY}")
-    if not INPUT_TIME_SUMMARY.exists():
-        raise FileNotFoundError(f"Missing: {INPUT_TIME_SUMMARY}")
+    df = load_table(INPUT_ARTICLES)
+    sec = load_table(INPUT_SECTION_SUMMARY)
+    t = load_table(INPUT_TIME_SUMMARY)
 
-    df = pd.read_csv(INPUT_ARTICLES)
-    sec = pd.read_csv(INPUT_SECTION_SUMMARY)
-    t = pd.read_csv(INPUT_TIME_SUMMARY)
+    # One figure for the whole batch; each plot resizes it and adds its own axes
+    fig = plt.figure()
 
     # -----------------------------
     # Fig 1: Number of articles per section
     # -----------------------------
     counts = df["section"].value_counts().sort_index()
-    plt.figure()
-    counts.plot(kind="bar")
-    plt.title("Number of Articles per Section (Election Aftermath Window)")
-    plt.xlabel("Section")
-    plt.ylabel("Count")
-    save_fig("fig1_articles_per_section.png")
+    start_fig(fig)
+    ax = fig.add_subplot()
+    counts.plot(kind="bar", ax=ax)
+    ax.set_title("Number of Articles per Section (Election Aftermath Window)")
+    ax.set_xlabel("Section")
+    ax.set_ylabel("Count")
+    save_fig(fig, "fig1_articles_per_section.png")
 
     # -----------------------------
     # Fig 2: Headline vs Body mean sentiment by section (grouped bars)
@@ -81,68 +129,51 @@ def main() -> None:
     sec_sorted = sec.sort_values("n_articles", ascending=False)
 
     x = range(len(sec_sorted))
-    plt.figure()
-    plt.bar([i - 0.2 for i in x], sec_sorted["mean_headline"], width=0.4, label="Headline")
-    plt.bar([i + 0.2 for i in x], sec_sorted["mean_body"], width=0.4, label="Body")
-
-    plt.title("Average VADER Compound Score: Headline vs Body (by Section)")
-    plt.xlabel("Section")
-    plt.ylabel("Mean compound score")
-    plt.xticks(list(x), sec_sorted["section"])
-    plt.legend()
-    save_fig("fig2_headline_vs_body_by_section.png")
+    start_fig(fig)
+    ax = fig.add_subplot()
+    ax.bar([i - 0.2 for i in x], sec_sorted["mean_headline"], width=0.4, label="Headline")
+    ax.bar([i + 0.2 for i in x], sec_sorted["mean_body"], width=0.4, label="Body")
+
+    ax.set_title("Average VADER Compound Score: Headline vs Body (by Section)")
+    ax.set_xlabel("Section")
+    ax.set_ylabel("Mean compound score")
+    ax.set_xticks(list(x), sec_sorted["section"])
+    ax.legend()
+    save_fig(fig, "fig2_headline_vs_body_by_section.png")
 
     # -----------------------------
     # Fig 3: Distribution of headline-minus-body sentiment
     # -----------------------------
-    plt.figure()
-    df["headline_minus_body"].hist(bins=30)
-    plt.title("Distribution of (Headline - Body) VADER Compound Scores")
-    plt.xlabel("headline_minus_body")
-    plt.ylabel("Frequency")
-    save_fig("fig3_headline_minus_body_distribution.png")
+    start_fig(fig)
+    ax = fig.add_subplot()
+    df["headline_minus_body"].hist(bins=30, ax=ax)
+    ax.set_title("Distribution of (Headline - Body) VADER Compound Scores")
+    ax.set_xlabel("headline_minus_body")
+    ax.set_ylabel("Frequency")
+    save_fig(fig, "fig3_headline_minus_body_distribution.png")
 
     # -----------------------------
     # Fig 4: Label proportions (headline vs body) by section (stacked bars)
     # -----------------------------
-    # headline label proportions
-    headline_counts = (
-        df.groupby(["section", "headline_label"])
-        .size()
-        .unstack(fill_value=0)
-        .reindex(index=sorted(df["section"].unique()))
-    )
-    headline_props = headline_counts.div(headline_counts.sum(axis=1), axis=0)
-
-    # body label proportions
-    body_counts = (
-        df.groupby(["section", "body_label"])
-        .size()
-        .unstack(fill_value=0)
-        .reindex(index=sorted(df["section"].unique()))
-    )
-    body_props = body_counts.div(body_counts.sum(axis=1), axis=0)
+    headline_props, body_props = load_label_props(df)
 
     # Plot in two stacked bar charts (headline on top, body on bottom)
-    plt.figure(figsize=(9, 7))
-    ax1 = plt.subplot(2, 1, 1)
+    start_fig(fig, (9, 7))
+    ax1 = fig.add_subplot(2, 1, 1)
     headline_props.plot(kind="bar", stacked=True, ax=ax1)
     ax1.set_title("Headline Sentiment Label Proportions by Section")
     ax1.set_xlabel("")
     ax1.set_ylabel("Proportion")
     ax1.legend(title="Label", bbox_to_anchor=(1.02, 1), loc="upper left")
 
-    ax2 = plt.subplot(2, 1, 2)
+    ax2 = fig.add_subplot(2, 1, 2)
     body_props.plot(kind="bar", stacked=True, ax=ax2)
     ax2.set_title("Body Sentiment Label Proportions by Section")
     ax2.set_xlabel("Section")
     ax2.set_ylabel("Proportion")
     ax2.legend(title="Label", bbox_to_anchor=(1.02, 1), loc="upper left")
 
-    plt.tight_layout()
-    plt.savefig(RESULTS_DIR / "fig4_label_proportions_headline_vs_body.png", dpi=200)
-    plt.close()
-    print("[SAVE] results/fig4_label_proportions_headline_vs_body.png")
+    save_fig(fig, "fig4_label_proportions_headline_vs_body.png")
 
     # -----------------------------
     # Fig 5: Time series (7-day rolling) of headline vs body sentiment
@@ -152,36 +183,51 @@ def main() -> None:
     t = t.dropna(subset=["date"])
     t = t.sort_values(["section", "date"])
 
-    # 7-day rolling within each section
-    t["headline_roll7"] = (
-        t.groupby("section")["mean_headline"]
+    # 7-day rolling within each section (both columns in one grouped pass;
+    # t is already sorted by section, so groupby can skip re-sorting the keys)
+    roll7 = (
+        t.groupby("section", sort=False, observed=True)[["mean_headline", "mean_body"]]
         .rolling(window=7, min_periods=3)
         .mean()
-        .reset_index(level=0, drop=True)
+        .droplevel(0)
     )
-    t["body_roll7"] = (
-        t.groupby("section")["mean_body"]
-        .rolling(window=7, min_periods=3)
-        .mean()
-        .reset_index(level=0, drop=True)
-    )
-
-    plt.figure(figsize=(10, 6))
-    for section, g in t.groupby("section"):
-        plt.plot(g["date"], g["headline_roll7"], label=f"{section} (headline)")
-        plt.plot(g["date"], g["body_roll7"], linestyle="--", label=f"{section} (body)")
+    t["headline_roll7"] = roll7["mean_headline"]
+    t["body_roll7"] = roll7["mean_body"]
+
+    # One column per section on a shared date index, so each style is a single .plot.
+    # Dates a section has no articles on are filled along the straight segment between
+    # its neighbouring points (only inside its own range), so lines stay unbroken.
+    def wide(col: str, suffix: str) -> pd.DataFrame:
+        w = t.pivot(index="date", columns="section", values=col)
+        w = w.interpolate(method="index", limit_area="inside")
+        w.columns = [f"{section} ({suffix})" for section in w.columns]
+        return w
+
+    wide_h = wide("headline_roll7", "headline")
+    wide_b = wide("body_roll7", "body")
+
+    # Headline/body pairs keep consecutive colors from the default cycle
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    n = wide_h.shape[1]
+    color_h = [colors[(2 * i) % len(colors)] for i in range(n)]
+    color_b = [colors[(2 * i + 1) % len(colors)] for i in range(n)]
+
+    start_fig(fig, (10, 6))
+    ax = fig.add_subplot()
+    wide_h.plot(ax=ax, color=color_h, x_compat=True, legend=False)
+    wide_b.plot(ax=ax, color=color_b, linestyle="--", x_compat=True, legend=False)
 
-    ax = plt.gca()
     ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
-    plt.xticks(rotation=45)
+    ax.tick_params(axis="x", labelrotation=45)
 
-    plt.title("Election Aftermath: 7-day Rolling Sentiment Over Time (Headline vs Body)")
-    plt.xlabel("Date")
-    plt.ylabel("7-day rolling mean compound score")
-    plt.legend(ncol=2, bbox_to_anchor=(1.02, 1), loc="upper left")
-    save_fig("fig5_time_series_headline_vs_body_rolling7d.png")
+    ax.set_title("Election Aftermath: 7-day Rolling Sentiment Over Time (Headline vs Body)")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("7-day rolling mean compound score")
+    ax.legend(ncol=2, bbox_to_anchor=(1.02, 1), loc="upper left")
+    save_fig(fig, "fig5_time_series_headline_vs_body_rolling7d.png")
 
+    plt.close(fig)
     print("[DONE] Visualizations created in results/.")
 
 
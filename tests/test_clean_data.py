@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import clean_data  # noqa: E402
+
+
+def test_load_raw_metadata_multi_block_with_quoted_newlines(tmp_path):
+    # Larger than Arrow's default 1 MiB block, with a newline inside every quoted body
+    n = 4000
+    raw = pd.DataFrame(
+        {
+            "url": [f"https://www.bbc.com/news/articles/a{i}" for i in range(n)],
+            "section": ["world"] * n,
+            "published_at": ["2025-01-02T10:00:00.000Z"] * n,
+            "headline": [f"Headline {i}" for i in range(n)],
+            "body_preview": [("word " * 60) + f"\nline two {i}" for i in range(n)],
+        }
+    )
+    path = tmp_path / "metadata.csv"
+    raw.to_csv(path, index=False)
+    assert path.stat().st_size > 1 << 20
+
+    out = clean_data.load_raw_metadata(path)
+    assert out["url"].tolist() == raw["url"].tolist()
+    assert out["body_preview"].tolist() == raw["body_preview"].tolist()
+    assert out["published_at"].tolist() == raw["published_at"].tolist()
+
+
+def test_parse_dates_falls_back_for_non_iso_strings(tmp_path):
+    # Go through load_raw_metadata so published_at has the production ArrowDtype
+    path = tmp_path / "metadata.csv"
+    pd.DataFrame(
+        {
+            "url": [f"https://www.bbc.com/news/articles/a{i}" for i in range(4)],
+            "published_at": ["2025-01-02T10:00:00.000Z", "3 February 2025", None, "not a date"],
+        }
+    ).to_csv(path, index=False)
+    df = clean_data.load_raw_metadata(path)
+    assert df["published_at"].dtype == pd.ArrowDtype(pa.string())
+
+    out = clean_data.parse_dates(df)
+    assert out["published_date"].tolist()[:2] == ["2025-01-02", "2025-02-03"]
+    assert out["published_dt"].isna().tolist() == [False, False, True, True]
@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import run_analysis  # noqa: E402
+
+
+def test_iter_clean_chunks_multi_block_with_quoted_newlines(tmp_path, monkeypatch):
+    n = 500
+    clean = pd.DataFrame(
+        {
+            "url": [f"https://www.bbc.com/news/articles/a{i}" for i in range(n)],
+            "section": ["world", "business"] * (n // 2),
+            "published_at": ["2025-01-02T10:00:00Z"] * n,
+            "published_date": ["2025-01-02"] * n,
+            "headline": [f"Headline {i}" for i in range(n)],
+            "body_preview": [f"First line {i}.\nSecond, \"quoted\" line." for i in range(n)],
+        }
+    )
+    path = tmp_path / "articles_clean.csv"
+    clean.to_csv(path, index=False)
+
+    monkeypatch.setattr(run_analysis, "INPUT_CLEAN", path)
+    monkeypatch.setattr(run_analysis, "CHUNK_BYTES", 4096)
+
+    chunks = list(run_analysis.iter_clean_chunks())
+    assert len(chunks) > 1
+
+    out = pd.concat(chunks, ignore_index=True)
+    assert out["url"].tolist() == clean["url"].tolist()
+    assert out["body_preview"].tolist() == clean["body_preview"].tolist()
+
+
+def test_iter_clean_chunks_header_only(tmp_path, monkeypatch):
+    path = tmp_path / "articles_clean.csv"
+    path.write_text(",".join(run_analysis.CLEAN_COLUMNS) + "\n")
+    monkeypatch.setattr(run_analysis, "INPUT_CLEAN", path)
+
+    chunks = list(run_analysis.iter_clean_chunks())
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert list(chunks[0].columns) == run_analysis.CLEAN_COLUMNS
+
+
+def test_init_vader_rebuilds_corrupt_lexicon_cache(tmp_path, monkeypatch):
+    cache = tmp_path / "vader_lex.pkl"
+    monkeypatch.setattr(run_analysis, "VADER_LEX_CACHE", cache)
+
+    fresh = run_analysis.init_vader()
+    assert cache.exists()
+    cached = run_analysis.init_vader()
+    assert cached.lexicon == fresh.lexicon
+    assert cached.polarity_scores("Great win, NOT bad!!") == fresh.polarity_scores("Great win, NOT bad!!")
+
+    cache.write_bytes(cache.read_bytes()[:100])
+    rebuilt = run_analysis.init_vader()
+    assert rebuilt.lexicon == fresh.lexicon
+    assert run_analysis.load_lexicon_cache() == fresh.lexicon
+    assert [p.name for p in tmp_path.iterdir()] == ["vader_lex.pkl"]
+
+
+def test_lexicon_filter_skips_only_zero_scores():
+    sia = run_analysis.init_vader()
+    texts = [
+        "",
+        "Minister of the BBC",
+        "GREAT win, but NOT bad!!",
+        "\"good\" news",
+        "'good'",
+        "kind of sad...",
+        "meh :) (-:",
+        "(-: ))",
+        "?!?love!!!",
+        "no",
+        "Budget set for 2025",
+    ]
+    lex_filter = run_analysis.lexicon_filter(sia)
+    scores = run_analysis.compound_scores(sia, np.array(texts, dtype=object))
+    for text, score in zip(texts, scores):
+        expected = sia.polarity_scores(text)["compound"] if text else 0.0
+        assert score == expected, text
+        if text and not lex_filter.can_score(text):
+            assert expected == 0.0, text
+    assert not lex_filter.can_score("Minister of the BBC")